@@ -318,3 +318,5 @@ CSS_PROPERTIES = (
     "orphans",
     "widows",
 )
+
+CSS_PROPERTY_NAMES: frozenset[str] = frozenset(CSS_PROPERTIES)
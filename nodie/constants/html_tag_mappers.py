@@ -443,3 +443,11 @@ EVENT_ATTRIBUTES = (
 
 
 UNIQUE_IDENTIFIER = "id"
+
+SELF_CLOSING_TAGS: frozenset[str] = frozenset(
+    tag_name for tag_name, (_, is_self_closed) in HTML_TAGS.items() if is_self_closed
+)
+
+# Elements whose text content browsers do not decode entities in; their text
+# children must be emitted as written.
+RAW_TEXT_TAGS: frozenset[str] = frozenset(("script", "style"))
@@ -1,40 +1,176 @@
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+
 from nodie import HTMLNode
+from nodie.constants.html_tag_mappers import HTML_TAGS, RAW_TEXT_TAGS
+from nodie.helpers.helpers import MAX_CACHED_FRAGMENT_LENGTH, escape_html_text
+from nodie.protocols.writer_protocols import HtmlWriterProtocol
+
+# Closing tags for every known tag, built once at import. Tags outside
+# HTML_TAGS (possible with the direct constructor) are formatted per call and
+# never stored, so caller input cannot grow this table.
+_CLOSING_TAGS: dict[str, str] = {tag_name: f"</{tag_name}>" for tag_name in HTML_TAGS}
 
 
 def node_to_html(child: HTMLNode | str) -> str:
     if isinstance(child, str):
-        return child
+        return escape_html_text(child)
     return to_html(child)
 
 
 def to_html(root_node: "HTMLNode") -> str:
-    inline_styles = root_node.inline_styles.to_string()
-    html_attrs = inline_styles + " " + root_node.attributes.attributes_to_html_string()
-    html: str
-    if root_node.is_self_closed_tag:
-        html = create_self_closing_tag_string(root_node, html_attrs)
-    else:
-        html = (
-            create_open_tag_string(root_node, html_attrs)
-            + "".join(node_to_html(child) for child in root_node.get_children())
-            + create_close_tag_string(root_node)
-        )
-    return html
+    buffer: list[str] = []
+    render_node(root_node, buffer)
+    return "".join(buffer)
+
+
+def to_html_bytes(root_node: "HTMLNode", encoding: str = "utf-8") -> bytes:
+    """Render a node tree straight to encoded bytes.
+
+    Intended for callers that write to files or sockets. Fragments are
+    collected in the shared buffer and encoded once after the join, which
+    in CPython is cheaper than encoding every fragment separately.
+
+    Args:
+        root_node: The node to render.
+        encoding: The output encoding. Defaults to UTF-8.
+
+    Returns:
+        The rendered HTML as bytes.
+    """
+    buffer: list[str] = []
+    render_node(root_node, buffer)
+    return "".join(buffer).encode(encoding)
+
+
+def write_html(root_node: "HTMLNode", out: HtmlWriterProtocol) -> None:
+    """Stream the HTML of a node tree to a writable object.
+
+    Fragments are passed to ``out.write`` as soon as they are produced, so
+    the document is never held in memory as a whole. Any file-like object
+    opened in text mode (or a WSGI/ASGI writer accepting ``str``) works.
+
+    Args:
+        root_node: The node to render.
+        out: The object receiving the rendered fragments.
+    """
+    _write_node(root_node, out.write)
+
+
+def render_node(node: HTMLNode, buffer: list[str]) -> None:
+    """Append the HTML fragments of a node and its subtree to a shared buffer.
+
+    Child HTML is never materialized as an intermediate string: every level
+    writes into the same buffer, which the caller joins exactly once.
+
+    Args:
+        node: The node to render.
+        buffer: The list that receives the rendered fragments.
+    """
+    _write_node(node, buffer.append)
+
+
+def _write_node(node: HTMLNode, append: Callable[[str], object]) -> None:
+    """Emit the fragments of a node and its subtree in document order.
+
+    Each stack entry holds an iterator over one element's children, the
+    closing tag to emit once it is exhausted, and whether that element is a
+    raw-text element (``script``/``style``) whose text must not be escaped.
+    Descending into a child is a push rather than a recursive call, so
+    document depth is not bounded by the interpreter recursion limit, and
+    text children are emitted as soon as they are reached instead of
+    round-tripping through the stack.
+    """
+    stack: list[tuple[Iterator[HTMLNode | str], str, bool]] = [
+        (iter((node,)), "", False)
+    ]
+    while stack:
+        children, closing_tag, raw_text = stack[-1]
+        for item in children:
+            if isinstance(item, str):
+                append(item if raw_text else escape_html_text(item))
+                continue
+
+            html_attrs = ""
+            if item.inline_styles.styles:
+                html_attrs = item.inline_styles.to_string()
+                if item.attributes.attributes:
+                    html_attrs += " " + item.attributes.attributes_to_html_string()
+            elif item.attributes.attributes:
+                html_attrs = item.attributes.attributes_to_html_string()
+            if item.is_self_closed_tag:
+                append(create_self_closing_tag_string(item, html_attrs))
+                continue
+
+            item_children = item.get_children()
+            if not item_children:
+                append(_empty_element(item.tag_name, html_attrs))
+                continue
+
+            append(create_open_tag_string(item, html_attrs))
+            stack.append(
+                (
+                    iter(item_children),
+                    create_close_tag_string(item),
+                    item.tag_name in RAW_TEXT_TAGS,
+                )
+            )
+            break
+        else:
+            stack.pop()
+            append(closing_tag)
 
 
 def create_open_tag_string(node: HTMLNode, html_attrs: str) -> str:
-    tag_template = f"{node.tag_name}"
-    if len(html_attrs) > 1:
-        tag_template += f"{html_attrs}"
-    return f"<{tag_template}>"
+    return _tag_opening(node.tag_name, html_attrs, ">")
 
 
 def create_close_tag_string(node: HTMLNode) -> str:
-    return f"</{node.tag_name}>"
+    return _closing_tag(node.tag_name)
+
+
+def _closing_tag(tag_name: str) -> str:
+    closing_tag = _CLOSING_TAGS.get(tag_name)
+    if closing_tag is None:
+        return f"</{tag_name}>"
+    return closing_tag
 
 
 def create_self_closing_tag_string(node: HTMLNode, html_attrs: str) -> str:
-    tag_template = f"{node.tag_name}"
-    if len(html_attrs) > 1:
-        tag_template += f"{html_attrs}"
-    return f"<{tag_template}/>"
+    return _tag_opening(node.tag_name, html_attrs, "/>")
+
+
+def _tag_opening(tag_name: str, html_attrs: str, tag_end: str) -> str:
+    # Long shapes are rendered directly so the cache never pins large
+    # caller values.
+    if len(tag_name) + len(html_attrs) > MAX_CACHED_FRAGMENT_LENGTH:
+        return _format_tag_opening(tag_name, html_attrs, tag_end)
+    return _render_tag_opening(tag_name, html_attrs, tag_end)
+
+
+@lru_cache(maxsize=4096)
+def _render_tag_opening(tag_name: str, html_attrs: str, tag_end: str) -> str:
+    """Render an opening or self-closing tag for a given node shape.
+
+    Repeated shapes such as ``<td class='text-right'>`` are rendered once and
+    then served from the cache.
+    """
+    return _format_tag_opening(tag_name, html_attrs, tag_end)
+
+
+def _format_tag_opening(tag_name: str, html_attrs: str, tag_end: str) -> str:
+    if html_attrs:
+        return f"<{tag_name} {html_attrs}{tag_end}"
+    return f"<{tag_name}{tag_end}"
+
+
+def _empty_element(tag_name: str, html_attrs: str) -> str:
+    if len(tag_name) + len(html_attrs) > MAX_CACHED_FRAGMENT_LENGTH:
+        return _format_tag_opening(tag_name, html_attrs, ">") + _closing_tag(tag_name)
+    return _render_empty_element(tag_name, html_attrs)
+
+
+@lru_cache(maxsize=4096)
+def _render_empty_element(tag_name: str, html_attrs: str) -> str:
+    """Render a childless element as one fragment, e.g. ``<td></td>``."""
+    return _format_tag_opening(tag_name, html_attrs, ">") + _closing_tag(tag_name)
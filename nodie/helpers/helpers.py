@@ -1,2 +1,36 @@
+import sys
+
+_TEXT_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_ATTRIBUTE_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}
+)
+
+# Fragments whose inputs are longer than this are rendered without going
+# through the module-level render caches, so large caller values (e.g.
+# data: URIs) are never kept alive by a cache entry.
+MAX_CACHED_FRAGMENT_LENGTH = 256
+
+
 def normalize_string_values(string: str) -> str:
     return string.strip().lower()
+
+
+def intern_string(value: str) -> str:
+    """Intern a plain ``str``; subclasses such as StrEnum members pass through.
+
+    ``sys.intern`` rejects str subclasses, which callers may legitimately
+    use for tag and attribute names.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+def escape_html_text(text: str) -> str:
+    """Escape a text node so it cannot open or close markup."""
+    return text.translate(_TEXT_ESCAPE_TABLE)
+
+
+def escape_html_attribute(value: str) -> str:
+    """Escape an attribute value so it cannot break out of its quotes."""
+    return value.translate(_ATTRIBUTE_ESCAPE_TABLE)
@@ -1,9 +1,62 @@
+from collections.abc import Mapping
+from functools import lru_cache
+
 from nodie.constants import html_tag_mappers
+from nodie.constants.types import AttrValue
+from nodie.helpers.helpers import (
+    MAX_CACHED_FRAGMENT_LENGTH,
+    escape_html_attribute,
+    intern_string,
+)
+
+
+@lru_cache(maxsize=4096)
+def _render_attributes(items: tuple[tuple[str, str], ...]) -> str:
+    """Render attribute pairs as an HTML attribute string.
+
+    The result depends only on the pairs themselves, so identical attribute
+    sets (e.g. ``{"class": "even-row"}`` on every other table row) are
+    rendered once and served from the cache afterwards.
+    """
+    return _format_attributes(items)
+
+
+def _format_attributes(items: tuple[tuple[str, str], ...]) -> str:
+    return " ".join([f"{key}='{escape_html_attribute(value)}'" for key, value in items])
+
+
+def _build_allowed_attribute_names(tag_name: str) -> frozenset[str]:
+    """Build the set of attribute names valid for ``tag_name``."""
+    full_attrs: tuple[str, ...] = (
+        html_tag_mappers.GLOBAL_ATTRIBUTES + html_tag_mappers.EVENT_ATTRIBUTES
+    )
+    main_attrs = html_tag_mappers.HTML_TAGS.get(tag_name, ())
+
+    if len(main_attrs) == 2:
+        full_attrs += main_attrs[0]
+
+    return frozenset(full_attrs)
+
+
+# Built once per known tag so membership checks are a hash probe instead of a
+# tuple scan. Unknown tag names are not stored, so caller input cannot grow it.
+_ALLOWED_ATTRIBUTE_NAMES: dict[str, frozenset[str]] = {
+    tag_name: _build_allowed_attribute_names(tag_name)
+    for tag_name in html_tag_mappers.HTML_TAGS
+}
 
 
 class Attributes:
-    def __init__(self, attributes: dict[str, str], tag_name: str) -> None:
-        self.attributes = self.introspect_attributes(tag_name, attributes)
+    __slots__ = ("attributes",)
+
+    def __init__(
+        self, attributes: Mapping[str, AttrValue | None], tag_name: str
+    ) -> None:
+        # Most elements carry no attributes; skip building the allowed-name
+        # list for them entirely.
+        self.attributes: dict[str, AttrValue] = (
+            self.introspect_attributes(tag_name, attributes) if attributes else {}
+        )
 
     def attributes_to_html_string(self) -> str:
         """Combine all node attributes into a single HTML attribute string.
@@ -18,10 +71,14 @@ class Attributes:
                 has attributes {'class': 'container', 'id': 'main'}, this returns
                 "class='container' id='main'".
         """
-        combined_attributes = " ".join(
-            f"{key}='{value}'" for key, value in self.attributes.items()
-        )
-        return combined_attributes if combined_attributes else ""
+        if not self.attributes:
+            return ""
+        # Key on the rendered text: 1, 1.0 and True are equal as dict keys
+        # but must not share a cache entry.
+        items = tuple([(key, str(value)) for key, value in self.attributes.items()])
+        if sum([len(value) for _, value in items]) > MAX_CACHED_FRAGMENT_LENGTH:
+            return _format_attributes(items)
+        return _render_attributes(items)
 
     def remove_attrs(self) -> None:
         """Remove all attributes from this node.
@@ -37,7 +94,7 @@ class Attributes:
         self.attributes = {}
 
     def update_attr(
-        self, attribute_name: str, new_value: str, create_new: bool = True
+        self, attribute_name: str, new_value: AttrValue, create_new: bool = True
     ) -> None:
         """Update or create an HTML attribute for this node.
 
@@ -63,10 +120,10 @@ class Attributes:
             if attribute_name in self.attributes:
                 self.attributes[attribute_name] = new_value
 
-    def get_attr(self, attribute_name: str) -> str:
+    def get_attr(self, attribute_name: str) -> AttrValue:
         """Retrieve the value of a specific attribute.
         Returns:
-            str: The value of the specified attribute, or None if the
+            AttrValue: The value of the specified attribute, or None if the
             attribute does not exist.
             If the attribute does not exist, this method returns empty string.
         """
@@ -82,8 +139,8 @@ class Attributes:
 
     @classmethod
     def introspect_attributes(
-        cls, tag_name: str, attributes: dict[str, str]
-    ) -> dict[str, str]:
+        cls, tag_name: str, attributes: Mapping[str, AttrValue | None]
+    ) -> dict[str, AttrValue]:
         """Validate and process HTML attributes for a specific tag.
 
         This method takes a dictionary of attributes and validates them against
@@ -93,21 +150,26 @@ class Attributes:
         Args:
             tag_name (str): The name of the HTML tag for which attributes are
             being validated.
-            attributes (dict[str, str]): A dictionary of attribute names and
-            their values
+            attributes (Mapping[str, AttrValue | None]): A mapping of attribute
+            names and their values
                 to be validated and processed.
 
         Returns:
-            dict[str, str]: A dictionary containing only the valid attributes with their
-                processed values. Invalid attributes are excluded from the result.
+            dict[str, AttrValue]: A dictionary containing only the valid attributes
+                with their processed values. Invalid attributes are excluded from
+                the result.
         """
-        cleaned_attrs = cls.clean_attrs_names(tag_name, tuple(attributes.keys()))
-        return dict(
-            filter(
-                lambda item: item[0] in cleaned_attrs and item[1] is not None,
-                attributes.items(),
-            )
-        )
+        allowed_attrs = cls.__combine_all_possible_attributes(tag_name)
+        if not attributes.keys() <= allowed_attrs:
+            # Only reached for invalid input; reports the unknown names.
+            cls.clean_attrs_names(tag_name, tuple(attributes.keys()))
+        # Keys are interned only once they have passed the allowlist, so
+        # arbitrary caller strings never enter the intern table.
+        return {
+            intern_string(key): value
+            for key, value in attributes.items()
+            if key in allowed_attrs and value is not None
+        }
 
     @classmethod
     def clean_attrs_names(
@@ -141,7 +203,7 @@ class Attributes:
         return tuple(clean_attrs)
 
     @classmethod
-    def __combine_all_possible_attributes(cls, tag_name: str) -> tuple[str, ...]:
+    def __combine_all_possible_attributes(cls, tag_name: str) -> frozenset[str]:
         """Combine all valid attributes for a specific HTML tag.
 
         This method aggregates all possible attributes that can be applied to a given
@@ -154,20 +216,15 @@ class Attributes:
                 possible valid attributes.
 
         Returns:
-            tuple[str, ...]: A tuple containing all valid attribute names for the
+            frozenset[str]: A set containing all valid attribute names for the
                 specified HTML tag, including global attributes, event attributes,
                 and tag-specific attributes. If the tag has no specific attributes
                 defined, only global and event attributes are returned.
         """
-        full_attrs: tuple[str, ...] = (
-            html_tag_mappers.GLOBAL_ATTRIBUTES + html_tag_mappers.EVENT_ATTRIBUTES
-        )
-        main_attrs = html_tag_mappers.HTML_TAGS.get(tag_name, ())
-
-        if len(main_attrs) == 2:
-            full_attrs += main_attrs[0]
-
-        return full_attrs
+        allowed_attrs = _ALLOWED_ATTRIBUTE_NAMES.get(tag_name)
+        if allowed_attrs is None:
+            allowed_attrs = _build_allowed_attribute_names(tag_name)
+        return allowed_attrs
 
-    def get_unique_id(self) -> str:
+    def get_unique_id(self) -> AttrValue:
         return self.attributes.get("id", "")
@@ -1,7 +1,30 @@
+import re
+from functools import lru_cache
 from typing import Any
 
-from nodie.constants.css_properties import CSS_PROPERTIES
-from nodie.helpers.helpers import normalize_string_values
+from nodie.constants.css_properties import CSS_PROPERTY_NAMES
+from nodie.helpers.helpers import (
+    MAX_CACHED_FRAGMENT_LENGTH,
+    escape_html_attribute,
+    normalize_string_values,
+)
+
+_DANGEROUS_STYLE_VALUE = re.compile(r"javascript:|expression\(|<script", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _render_styles(items: tuple[tuple[str, str], ...]) -> str:
+    """Render CSS property-value pairs as an inline style attribute.
+
+    Keyed on the pairs themselves, so nodes sharing the same declarations
+    reuse one rendered string.
+    """
+    return _format_styles(items)
+
+
+def _format_styles(items: tuple[tuple[str, str], ...]) -> str:
+    declarations = "; ".join([f"{prop}: {value}" for prop, value in items])
+    return f"style='{escape_html_attribute(declarations)};'"
 
 
 class InlineStyleAttributes:
@@ -11,13 +34,15 @@ class InlineStyleAttributes:
     standard CSS specifications.
     """
 
+    __slots__ = ("styles",)
+
     def __init__(self, styles: dict[str, str]) -> None:
         """Initialize inline styles with validation.
 
         Args:
             styles: Dictionary of CSS property-value pairs
         """
-        self.styles = self.validate_styles(styles)
+        self.styles = self.validate_styles(styles) if styles else {}
 
     @classmethod
     def validate_styles(cls, styles: dict[str, str]) -> dict[str, str]:
@@ -32,7 +57,7 @@ class InlineStyleAttributes:
         validated_styles = {}
 
         for property_name, value in styles.items():
-            if property_name in CSS_PROPERTIES:
+            if property_name in CSS_PROPERTY_NAMES:
                 normalized_property = property_name.strip().lower()
 
                 if cleaned_value := cls.clean_style_value(value):
@@ -57,12 +82,9 @@ class InlineStyleAttributes:
 
         str_value = str(value).strip()
 
-        dangerous_patterns = ["javascript:", "expression(", "<script"]
-
-        for pattern in dangerous_patterns:
-            if pattern.lower() in str_value.lower():
-                print(f"Warning: Potentially dangerous value '{str_value}' rejected.")
-                return ""
+        if _DANGEROUS_STYLE_VALUE.search(str_value):
+            print(f"Warning: Potentially dangerous value '{str_value}' rejected.")
+            return ""
 
         return str_value
 
@@ -70,13 +92,16 @@ class InlineStyleAttributes:
         """Convert styles dictionary to CSS string format.
 
         Returns:
-            String representation of styles in CSS format (property: value;)
+            The style attribute in CSS format (style='property: value;'),
+            or an empty string if no styles are set
         """
         if not self.styles:
             return ""
 
-        style_parts = [f"{prop}: {value}" for prop, value in self.styles.items()]
-        return f" style='{'; '.join(style_parts) + ';'}' "
+        items = tuple(self.styles.items())
+        if sum([len(value) for _, value in items]) > MAX_CACHED_FRAGMENT_LENGTH:
+            return _format_styles(items)
+        return _render_styles(items)
 
     def update_attr(
         self, attribute_name: str, value: str, create_new: bool = True
@@ -95,7 +120,7 @@ class InlineStyleAttributes:
 
         cleaned_value = self.clean_style_value(value)
         if cleaned_value:
-            if normalized_property in CSS_PROPERTIES:
+            if normalized_property in CSS_PROPERTY_NAMES:
                 self.styles[normalized_property] = cleaned_value
             else:
                 print(f"Warning: Invalid property '{attribute_name}'.")
@@ -106,8 +131,10 @@ class InlineStyleAttributes:
         Args:
             attribute_name: Name of the CSS property to remove
         """
-        normalized_property = attribute_name.strip().lower()
-        self.styles.pop(normalized_property, None)
+        # Stored keys are already normalized, so an exact hit needs no
+        # strip/lower pass.
+        if self.styles.pop(attribute_name, None) is None:
+            self.styles.pop(normalize_string_values(attribute_name), None)
 
     def remove_attrs(self) -> None:
         """Remove all styles."""
@@ -122,5 +149,6 @@ class InlineStyleAttributes:
         Returns:
             Value of the property, or empty string if not found
         """
-        normalized_property = normalize_string_values(attribute_name)
-        return self.styles.get(normalized_property, "")
+        if (value := self.styles.get(attribute_name)) is not None:
+            return value
+        return self.styles.get(normalize_string_values(attribute_name), "")
@@ -1,21 +1,54 @@
+from collections.abc import Iterator, Mapping
 from typing import Any
 
-from nodie.constants.html_tag_mappers import HTML_TAGS
-from nodie.constants.types import ExternalAttributesType, NodeAttributesType
+from nodie.constants.html_tag_mappers import HTML_TAGS, SELF_CLOSING_TAGS
+from nodie.constants.types import (
+    AttrValue,
+    ExternalAttributesType,
+    NodeAttributesType,
+)
+from nodie.helpers.helpers import intern_string
 from nodie.primitives.attributes import Attributes
 from nodie.primitives.inline_style_attributes import InlineStyleAttributes
 
+# Adjacent text children shorter than this are merged on insertion.
+TEXT_MERGE_THRESHOLD = 128
+
 
 class Children:
-    def __init__(self, children: list["HTMLNode | str"]) -> None:
-        self.children: list[HTMLNode | str] = children
+    __slots__ = ("children",)
+
+    def __init__(
+        self, children: "list[HTMLNode | str] | tuple[HTMLNode | str, ...]"
+    ) -> None:
+        # A list is kept as-is so callers can keep a reference to it.
+        self.children: list[HTMLNode | str] = (
+            children if isinstance(children, list) else list(children)
+        )
+
+    def __iter__(self) -> "Iterator[HTMLNode | str]":
+        return iter(self.children)
+
+    def __len__(self) -> int:
+        return len(self.children)
 
     def add_child(self, child_node: "HTMLNode | str") -> None:
-        if not isinstance(child_node, HTMLNode | str):
+        children = self.children
+        if isinstance(child_node, str):
+            if (
+                children
+                and isinstance(last_child := children[-1], str)
+                and len(last_child) + len(child_node) < TEXT_MERGE_THRESHOLD
+            ):
+                # Text is escaped at render time, so joining two adjacent text
+                # nodes renders identically while keeping the list shorter.
+                children[-1] = last_child + child_node
+                return
+        elif not isinstance(child_node, HTMLNode):
             raise TypeError(
                 f"Child must be Node or str, got {type(child_node).__name__}"
             )
-        self.children.append(child_node)
+        children.append(child_node)
 
     def add_children(self, new_children: "tuple[HTMLNode | str,...]") -> None:
         self.children.extend(new_children)
@@ -32,6 +65,16 @@ class Children:
 
 
 class HTMLNode:
+    __slots__ = (
+        "_node_id",
+        "tag_name",
+        "attributes",
+        "inline_styles",
+        "children",
+        "is_self_closed_tag",
+        "attrs_map_identifier",
+    )
+
     def __init__(
         self,
         tag_name: str,
@@ -40,7 +83,7 @@ class HTMLNode:
         inline_styles: InlineStyleAttributes,
         children: Children,
         attrs_map_identifier: str = "default",
-    ):
+    ) -> None:
         self._node_id = attributes.get_unique_id()
         self.tag_name = tag_name
         self.attributes = attributes
@@ -50,7 +93,7 @@ class HTMLNode:
         self.attrs_map_identifier = attrs_map_identifier
 
     @property
-    def node_id(self) -> str:
+    def node_id(self) -> AttrValue:
         return self._node_id
 
     def update_node_id(self) -> None:
@@ -62,26 +105,67 @@ class HTMLNode:
         interpretable_data: NodeAttributesType,
         attrs_mapper: ExternalAttributesType | None = None,
     ) -> "HTMLNode":
-        tag_name = interpretable_data.get("tag_name")
+        root, root_children = cls.__create_node_from_dict(
+            interpretable_data, attrs_mapper
+        )
+
+        # Walk the nested dictionaries with an explicit stack instead of
+        # recursing, so deep documents cost no Python frame per level and
+        # are not bounded by the interpreter recursion limit.
+        stack: list[tuple[HTMLNode, tuple[Any, ...] | list[Any]]] = [
+            (root, root_children)
+        ]
+        create_node = cls.__create_node_from_dict
+        push = stack.append
+        while stack:
+            node, children_data = stack.pop()
+            append_child = node.children.children.append
+            for child_data in children_data:
+                if isinstance(child_data, dict):
+                    child, grandchildren = create_node(child_data)
+                    append_child(child)
+                    if grandchildren:
+                        push((child, grandchildren))
+                else:
+                    append_child(child_data)
+
+        return root
+
+    @classmethod
+    def __create_node_from_dict(
+        cls,
+        interpretable_data: Mapping[str, Any],
+        attrs_mapper: ExternalAttributesType | None = None,
+    ) -> "tuple[HTMLNode, tuple[Any, ...] | list[Any]]":
+        """Create a single childless node and return it with its raw children."""
+        tag_name: object = interpretable_data.get("tag_name")
 
         if not isinstance(tag_name, str):
-            raise TypeError("Tag name must be a string, got {type(tag_name).__name__}")
+            raise TypeError(f"Tag name must be a string, got {type(tag_name).__name__}")
 
         # Check if the dictionary contains required keys
-        if tag_name is None or (tag_values := HTML_TAGS.get(tag_name, None)) is None:
+        if tag_name is None or tag_name not in HTML_TAGS:
             raise ValueError("Dictionary must contain valid 'tag_name' key")
 
-        is_self_closed_tag = tag_values[1]
+        # Tag names repeat across the whole document, so interning them makes
+        # later dict probes compare by identity. Only validated names get here.
+        tag_name = intern_string(tag_name)
+
+        is_self_closed_tag = tag_name in SELF_CLOSING_TAGS
 
         raw_attrs, attrs_identifier = cls.__generate_raw_attributes_from_dict(
             interpretable_data, attrs_mapper
         )
 
-        inline_styles = cls.__create_inline_style_attributes_instance(raw_attrs)
-        clean_attrs = cls.__clean_attributes(raw_attrs)
+        if raw_attrs:
+            inline_styles = cls.__create_inline_style_attributes_instance(raw_attrs)
+            attributes = Attributes(cls.__clean_attributes(raw_attrs), tag_name)
+        else:
+            # Most nodes in a document carry no attributes at all.
+            inline_styles = InlineStyleAttributes({})
+            attributes = Attributes({}, tag_name)
 
-        attributes = Attributes(clean_attrs, tag_name)
-        children = interpretable_data.get("children", ())
+        children: Any = interpretable_data.get("children", ())
 
         if not isinstance(children, tuple | list):
             raise TypeError(
@@ -94,16 +178,18 @@ class HTMLNode:
             is_self_closed_tag,
             inline_styles=inline_styles,
             attrs_map_identifier=attrs_identifier,
-            children=cls.generate_children(children),
+            children=Children([]),
         )
 
-        return node
+        return node, children
 
     def get_children(self) -> list["HTMLNode | str"]:
         return self.children.children
 
     @classmethod
-    def generate_children(cls, children: tuple[dict[str, Any] | str, ...]) -> Children:
+    def generate_children(
+        cls, children: tuple[dict[str, Any] | str, ...] | list[dict[str, Any] | str]
+    ) -> Children:
         children_nodes: list[HTMLNode | str] = []
         for child_data in children:
             if isinstance(child_data, dict):
@@ -114,7 +200,7 @@ class HTMLNode:
 
     @staticmethod
     def __create_inline_style_attributes_instance(
-        raw_attrs: NodeAttributesType,
+        raw_attrs: Mapping[str, object],
     ) -> InlineStyleAttributes:
         if "style" not in raw_attrs:
             return InlineStyleAttributes({})
@@ -129,11 +215,11 @@ class HTMLNode:
     @classmethod
     def __generate_raw_attributes_from_dict(
         cls,
-        interpretable_data: dict[str, Any],
+        interpretable_data: Mapping[str, Any],
         attrs_mapper: dict[str, NodeAttributesType] | None = None,
-    ) -> tuple[NodeAttributesType, str]:
+    ) -> tuple[Mapping[str, object], str]:
         if not attrs_mapper:
-            return interpretable_data.get("attributes", {}), "default"
+            return interpretable_data.get("attributes") or {}, "default"
 
         attrs_identifier = interpretable_data.get("attrs_map_identifier")
         if attrs_identifier is None:
@@ -144,9 +230,7 @@ class HTMLNode:
         return mapped_attrs, attrs_identifier
 
     @classmethod
-    def __clean_attributes(
-        cls, raw_attrs: dict[str, str | dict[str, str]]
-    ) -> dict[str, str]:
+    def __clean_attributes(cls, raw_attrs: Mapping[str, object]) -> dict[str, str]:
         clean_attrs: dict[str, str] = {
             key: value
             for key, value in raw_attrs.items()
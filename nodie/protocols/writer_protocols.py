@@ -0,0 +1,9 @@
+from typing import Protocol
+
+
+class HtmlWriterProtocol(Protocol):
+    def write(self, fragment: str, /) -> object:
+        """
+        Writes a rendered HTML fragment.
+        """
+        ...
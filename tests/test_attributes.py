@@ -0,0 +1,63 @@
+from typing import Any
+
+from nodie.primitives import attributes as attributes_module
+from nodie.primitives.attributes import Attributes
+
+
+def test_attributes_to_html_string_reflects_updates_after_render() -> None:
+    # Arrange
+    attributes = Attributes({"class": "even-row"}, "tr")
+    first_render = attributes.attributes_to_html_string()
+
+    # Act
+    attributes.update_attr("class", "odd-row")
+    second_render = attributes.attributes_to_html_string()
+
+    # Assert
+    assert first_render == "class='even-row'"
+    assert second_render == "class='odd-row'"
+
+
+def test_attributes_keep_only_names_allowed_for_tag() -> None:
+    # Act
+    attributes = Attributes({"src": "a.png", "id": "logo", "bogus": "x"}, "img")
+
+    # Assert
+    assert attributes.attributes == {"src": "a.png", "id": "logo"}
+
+
+def test_attributes_for_unknown_tag_allow_global_names_without_caching() -> None:
+    # Act
+    attributes = Attributes({"id": "x", "src": "a.png"}, "not-a-tag")
+
+    # Assert
+    assert attributes.attributes == {"id": "x"}
+    assert "not-a-tag" not in attributes_module._ALLOWED_ATTRIBUTE_NAMES
+
+
+def test_attributes_to_html_string_keeps_equal_values_of_different_types() -> None:
+    # Arrange
+    values: list[Any] = [1, True, 1.0]
+
+    # Act
+    rendered = [
+        Attributes({"tabindex": value}, "div").attributes_to_html_string()
+        for value in values
+    ]
+
+    # Assert
+    assert rendered == ["tabindex='1'", "tabindex='True'", "tabindex='1.0'"]
+
+
+def test_attributes_with_long_values_render_without_caching() -> None:
+    # Arrange
+    uri = "data:image/png;base64," + "A" * 1000
+    attributes = Attributes({"src": uri}, "img")
+    attributes_module._render_attributes.cache_clear()
+
+    # Act
+    rendered = attributes.attributes_to_html_string()
+
+    # Assert
+    assert rendered == f"src='{uri}'"
+    assert attributes_module._render_attributes.cache_info().currsize == 0
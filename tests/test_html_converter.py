@@ -0,0 +1,239 @@
+import io
+from typing import Any
+
+from nodie import (
+    Attributes,
+    HTMLNode,
+    InlineStyleAttributes,
+    to_html,
+    to_html_bytes,
+    write_html,
+)
+from nodie.converters import html_converter
+from nodie.primitives.node import Children
+
+
+def test_to_html_renders_nested_children_in_order() -> None:
+    # Arrange
+    data: dict[str, Any] = {
+        "tag_name": "ul",
+        "children": [
+            {"tag_name": "li", "children": ["first"]},
+            {"tag_name": "li", "children": ["second"]},
+        ],
+    }
+    node = HTMLNode.from_dict(data)
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == "<ul><li>first</li><li>second</li></ul>"
+
+
+def test_to_html_renders_mixed_text_and_element_children() -> None:
+    # Arrange
+    data: dict[str, Any] = {
+        "tag_name": "p",
+        "children": ["This is ", {"tag_name": "em", "children": ["mixed"]}, "."],
+    }
+    node = HTMLNode.from_dict(data)
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == "<p>This is <em>mixed</em>.</p>"
+
+
+def test_to_html_renders_self_closing_tag() -> None:
+    # Arrange
+    data: dict[str, Any] = {"tag_name": "div", "children": [{"tag_name": "br"}]}
+    node = HTMLNode.from_dict(data)
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == "<div><br/></div>"
+
+
+def test_to_html_escapes_text_children() -> None:
+    # Arrange
+    data: dict[str, Any] = {"tag_name": "p", "children": ["1 < 2 & <b>"]}
+    node = HTMLNode.from_dict(data)
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == "<p>1 &lt; 2 &amp; &lt;b&gt;</p>"
+
+
+def test_to_html_escapes_quotes_in_attribute_values() -> None:
+    # Arrange
+    node = HTMLNode.from_dict(
+        {"tag_name": "div", "attributes": {"title": 'it\'s "quoted"'}}
+    )
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == "<div title='it&#39;s &quot;quoted&quot;'></div>"
+
+
+def test_to_html_renders_inline_styles_in_declaration_order() -> None:
+    # Arrange
+    data: dict[str, Any] = {
+        "tag_name": "div",
+        "attributes": {"style": {"color": "red", "font-size": "12px"}},
+    }
+    node = HTMLNode.from_dict(data)
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == "<div style='color: red; font-size: 12px;'></div>"
+
+
+def test_to_html_bytes_matches_encoded_to_html() -> None:
+    # Arrange
+    data: dict[str, Any] = {
+        "tag_name": "p",
+        "attributes": {"lang": "be"},
+        "children": ["Прывітанне"],
+    }
+    node = HTMLNode.from_dict(data)
+
+    # Act
+    html_bytes = to_html_bytes(node)
+
+    # Assert
+    assert html_bytes == to_html(node).encode("utf-8")
+
+
+def test_to_html_renders_structures_deeper_than_recursion_limit() -> None:
+    # Arrange
+    depth = 2000
+    data: dict[str, Any] = {"tag_name": "span", "children": ["leaf"]}
+    for _ in range(depth):
+        data = {"tag_name": "div", "children": [data]}
+    node = HTMLNode.from_dict(data)
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == "<div>" * depth + "<span>leaf</span>" + "</div>" * depth
+
+
+def test_write_html_streams_same_markup_as_to_html() -> None:
+    # Arrange
+    data: dict[str, Any] = {
+        "tag_name": "table",
+        "children": [
+            {"tag_name": "tr", "children": [{"tag_name": "td", "children": ["1"]}]},
+            {"tag_name": "tr", "children": [{"tag_name": "td"}]},
+        ],
+    }
+    node = HTMLNode.from_dict(data)
+    out = io.StringIO()
+
+    # Act
+    write_html(node, out)
+
+    # Assert
+    assert out.getvalue() == to_html(node)
+    assert out.getvalue() == ("<table><tr><td>1</td></tr><tr><td></td></tr></table>")
+
+
+def test_to_html_separates_styles_and_attributes_with_single_space() -> None:
+    # Arrange
+    data: dict[str, Any] = {
+        "tag_name": "img",
+        "attributes": {"src": "a.png", "style": {"width": "10px"}},
+    }
+    node = HTMLNode.from_dict(data)
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == "<img style='width: 10px;' src='a.png'/>"
+
+
+def test_to_html_closes_unknown_tags_without_storing_them() -> None:
+    # Arrange
+    node = HTMLNode(
+        "x-widget",
+        Attributes({}, "x-widget"),
+        False,
+        inline_styles=InlineStyleAttributes({}),
+        children=Children(["hi"]),
+    )
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == "<x-widget>hi</x-widget>"
+    assert "x-widget" not in html_converter._CLOSING_TAGS
+
+
+def test_to_html_keeps_script_content_raw() -> None:
+    # Arrange
+    data: dict[str, Any] = {"tag_name": "script", "children": ["if (a < b && c) {}"]}
+    node = HTMLNode.from_dict(data)
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == "<script>if (a < b && c) {}</script>"
+
+
+def test_to_html_keeps_style_content_raw_but_escapes_siblings() -> None:
+    # Arrange
+    data: dict[str, Any] = {
+        "tag_name": "div",
+        "children": [{"tag_name": "style", "children": ["ul > li {}"]}, "a > b"],
+    }
+    node = HTMLNode.from_dict(data)
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == "<div><style>ul > li {}</style>a &gt; b</div>"
+
+
+def test_to_html_renders_long_self_closing_tags_without_caching() -> None:
+    # Arrange
+    uri = "data:image/png;base64," + "A" * 1000
+    data: dict[str, Any] = {"tag_name": "img", "attributes": {"src": uri}}
+    node = HTMLNode.from_dict(data)
+    html_converter._render_tag_opening.cache_clear()
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == f"<img src='{uri}'/>"
+    assert html_converter._render_tag_opening.cache_info().currsize == 0
+
+
+def test_to_html_renders_long_empty_elements_without_caching() -> None:
+    # Arrange
+    title = "t" * 1000
+    data: dict[str, Any] = {"tag_name": "div", "attributes": {"title": title}}
+    node = HTMLNode.from_dict(data)
+    html_converter._render_empty_element.cache_clear()
+
+    # Act
+    html = to_html(node)
+
+    # Assert
+    assert html == f"<div title='{title}'></div>"
+    assert html_converter._render_empty_element.cache_info().currsize == 0
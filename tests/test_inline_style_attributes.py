@@ -0,0 +1,53 @@
+import pytest
+
+from nodie.primitives import inline_style_attributes
+from nodie.primitives.inline_style_attributes import InlineStyleAttributes
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["url(JavaScript:alert(1))", "EXPRESSION(alert(1))", "<Script>alert(1)"],
+)
+def test_clean_style_value_rejects_dangerous_values_case_insensitively(
+    value: str,
+) -> None:
+    # Act
+    cleaned = InlineStyleAttributes.clean_style_value(value)
+
+    # Assert
+    assert cleaned == ""
+
+
+def test_clean_style_value_keeps_safe_values() -> None:
+    # Act
+    cleaned = InlineStyleAttributes.clean_style_value("  rgba(0,0,0,0.1) ")
+
+    # Assert
+    assert cleaned == "rgba(0,0,0,0.1)"
+
+
+def test_get_and_remove_attr_normalize_property_names() -> None:
+    # Arrange
+    styles = InlineStyleAttributes({"color": "red", "margin": "0"})
+
+    # Act
+    color = styles.get_attr(" Color ")
+    styles.remove_attr("MARGIN")
+
+    # Assert
+    assert color == "red"
+    assert styles.styles == {"color": "red"}
+
+
+def test_to_string_with_long_values_renders_without_caching() -> None:
+    # Arrange
+    image = "url(" + "a" * 1000 + ")"
+    styles = InlineStyleAttributes({"background-image": image})
+    inline_style_attributes._render_styles.cache_clear()
+
+    # Act
+    rendered = styles.to_string()
+
+    # Assert
+    assert rendered == f"style='background-image: {image};'"
+    assert inline_style_attributes._render_styles.cache_info().currsize == 0
@@ -1,4 +1,10 @@
-from nodie import HTMLNode
+import sys
+from enum import StrEnum
+from typing import Any
+
+import pytest
+
+from nodie import HTMLNode, to_html
 from nodie.primitives.attributes import Attributes
 from nodie.primitives.inline_style_attributes import InlineStyleAttributes
 from nodie.primitives.node import Children
@@ -33,3 +39,152 @@ def test_create_html_node_instance_with_all_parameters() -> None:
     assert node.attrs_map_identifier == attrs_map_identifier
     assert isinstance(node.node_id, str)
     assert len(node.node_id) > 0
+
+
+def test_children_iterates_over_items_in_insertion_order() -> None:
+    # Arrange
+    first = HTMLNode.from_dict({"tag_name": "li", "attributes": {"id": "first"}})
+    last = HTMLNode.from_dict({"tag_name": "li", "attributes": {"id": "last"}})
+    children = Children([first, "text"])
+
+    # Act
+    children.add_child(last)
+
+    # Assert
+    assert list(children) == [first, "text", last]
+    assert len(children) == 3
+
+
+def test_from_dict_builds_structures_deeper_than_recursion_limit() -> None:
+    # Arrange
+    depth = 2000
+    data: dict[str, Any] = {"tag_name": "span", "children": ["leaf"]}
+    for _ in range(depth):
+        data = {"tag_name": "div", "children": [data]}
+
+    # Act
+    node = HTMLNode.from_dict(data)
+
+    # Assert
+    for _ in range(depth):
+        assert node.tag_name == "div"
+        child = node.get_children()[0]
+        assert isinstance(child, HTMLNode)
+        node = child
+    assert node.tag_name == "span"
+    assert node.get_children() == ["leaf"]
+
+
+def test_add_child_merges_adjacent_short_text_children() -> None:
+    # Arrange
+    data: dict[str, Any] = {"tag_name": "em", "children": ["mixed"]}
+    emphasis = HTMLNode.from_dict(data)
+    children = Children(["This is ", emphasis])
+
+    # Act
+    children.add_child(" text with ")
+    children.add_child("content.")
+
+    # Assert
+    assert children.children == ["This is ", emphasis, " text with content."]
+
+
+def test_add_child_rejects_unsupported_child_types() -> None:
+    # Arrange
+    children = Children([])
+    child: Any = 42
+
+    # Act / Assert
+    with pytest.raises(TypeError, match="Child must be Node or str, got int"):
+        children.add_child(child)
+
+
+def test_from_dict_reports_non_string_tag_name_type() -> None:
+    # Arrange
+    data: dict[str, Any] = {"tag_name": 5}
+
+    # Act / Assert
+    with pytest.raises(TypeError, match="Tag name must be a string, got int"):
+        HTMLNode.from_dict(data)
+
+
+def test_remove_child_matches_id_captured_at_construction() -> None:
+    # Arrange
+    data: dict[str, Any] = {
+        "tag_name": "ul",
+        "children": [{"tag_name": "li", "attributes": {"id": "old"}}],
+    }
+    parent = HTMLNode.from_dict(data)
+    item = parent.get_children()[0]
+    assert isinstance(item, HTMLNode)
+    item.attributes.update_attr("id", "new")
+
+    # Act
+    parent.children.remove_child("old")
+
+    # Assert
+    assert parent.get_children() == []
+
+
+def test_children_accepts_tuple_and_stays_appendable() -> None:
+    # Arrange
+    children = Children(("a",))
+
+    # Act
+    children.add_child(HTMLNode.from_dict({"tag_name": "br"}))
+
+    # Assert
+    assert len(children) == 2
+
+
+def test_from_dict_treats_none_attributes_as_empty() -> None:
+    # Arrange
+    data: dict[str, Any] = {"tag_name": "div", "attributes": None}
+
+    # Act
+    node = HTMLNode.from_dict(data)
+
+    # Assert
+    assert node.attributes.attributes == {}
+
+
+def test_from_dict_interns_tag_names() -> None:
+    # Arrange
+    tag_name = "".join(["d", "iv"])
+
+    # Act
+    node = HTMLNode.from_dict({"tag_name": tag_name})
+
+    # Assert
+    assert node.tag_name is sys.intern("div")
+
+
+def test_from_dict_accepts_str_enum_tag_and_attribute_names() -> None:
+    # Arrange
+    class Tag(StrEnum):
+        DIV = "div"
+
+    class Attr(StrEnum):
+        CLASS = "class"
+
+    data: dict[str, Any] = {"tag_name": Tag.DIV, "attributes": {Attr.CLASS: "x"}}
+
+    # Act
+    html = to_html(HTMLNode.from_dict(data))
+
+    # Assert
+    assert html == "<div class='x'></div>"
+
+
+def test_from_dict_returns_instances_of_the_calling_subclass() -> None:
+    # Arrange
+    class MyNode(HTMLNode):
+        def describe(self) -> str:
+            return f"<{self.tag_name}>"
+
+    # Act
+    node = MyNode.from_dict({"tag_name": "div"})
+
+    # Assert
+    assert type(node) is MyNode
+    assert node.describe() == "<div>"